@@ -12,9 +12,15 @@ import streamlit as st
 import sqlite3
 import json
 import os
+import bisect
 import urllib.parse
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # stdlib fallback
+    orjson = None
+
 st.set_page_config(
     page_title="CITADEL Blinded Review",
     page_icon="C",
@@ -25,11 +31,18 @@ st.set_page_config(
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 SAMPLE_PATH = os.path.join(BASE_DIR, "data", "review_sample_round5_100.json")
 VERDICTS_DIR = os.path.join(BASE_DIR, "data", "verdicts_round5")
-os.makedirs(VERDICTS_DIR, exist_ok=True)
+_DB_PREFIX = os.path.join(VERDICTS_DIR, "reviewer_")
+
+VERDICT_LABELS = {
+    "fabricated": "Fabricated Citation \u2014 Does not exist anywhere",
+    "not_fabricated": "Not Fabricated \u2014 Paper exists (even if PMID/DOI wrong)",
+    "unsure": "Unsure \u2014 Cannot determine",
+}
+VERDICT_KEYS = tuple(VERDICT_LABELS)
 
 # ─── CSS ──────────────────────────────────────────────────────────────────
 
-st.html("""
+CSS = """
 <style>
     @import url('https://fonts.googleapis.com/css2?family=DM+Sans:wght@400;500;600;700&family=DM+Mono:wght@400;500&display=swap');
     .block-container { padding-top: 0.5rem !important; padding-bottom: 0 !important; max-width: 1400px !important; }
@@ -139,14 +152,136 @@ st.html("""
         box-shadow: 0 2px 6px rgba(0,0,0,0.06);
     }
 </style>
-""")
+"""
+
+# Must be emitted on every run: Streamlit drops any element a rerun doesn't
+# re-emit, so a once-per-session injection would lose the styles on the next click.
+st.html(CSS)
 
 
 # ─── Data & DB functions ──────────────────────────────────────────────────
 
+def loads_json(data):
+    """Parse JSON from bytes or str, with orjson when available."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def dumps_json(obj, indent=False):
+    """Serialize to UTF-8 JSON bytes (what st.download_button sends), with orjson when available."""
+    if orjson:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False, sort_keys=True).encode()
+
+def entry_links(title, authors, year):
+    """(url-encoded title, first author for PubMed, year_lo, year_hi) for the search links."""
+    encoded_title = urllib.parse.quote(title[:200])
+    first_author = (authors.split(";")[0].split(",")[0].strip() if authors else "").replace(" ", "+")
+    year_int = int(year) if year and str(year).isdigit() else 2024
+    return encoded_title, first_author, year_int - 1, year_int + 1
+
+def build_entry_html(entry):
+    """Pre-render the static HTML blocks for one sample entry."""
+    html = {"source": "", "actual": "", "author_search": ""}
+
+    # Source paper banner
+    source_title = entry.get("paper_title", "")
+    source_journal = entry.get("journal", "")
+    pmc_id = entry.get("pmc_id", "")
+
+    if source_title:
+        pmc_link = f"https://www.ncbi.nlm.nih.gov/pmc/articles/{pmc_id}/"
+        html["source"] = f"""
+        <div class="source-banner">
+            <span class="source-label">Citing Article</span>
+            <a href="{pmc_link}" target="_blank">{source_title[:120]}{'...' if len(source_title) > 120 else ''}</a>
+            <span style="color:#918e85;"> &middot; {source_journal} &middot; {pmc_id}</span>
+        </div>
+        """
+
+    # Claimed citation
+    title = entry.get("claimed_title", "N/A")
+    pmid = entry.get("claimed_pmid", "")
+    doi = entry.get("claimed_doi", "")
+    authors = entry.get("claimed_authors", "")
+    venue = entry.get("claimed_venue", "")
+    year = entry.get("claimed_year", "")
+
+    pmid_link = f'<a href="https://pubmed.ncbi.nlm.nih.gov/{pmid}/" target="_blank">{pmid}</a>' if pmid else "N/A"
+    doi_link = f'<a href="https://doi.org/{doi}" target="_blank">{doi}</a>' if doi else "N/A"
+
+    html["card"] = f"""
+    <div class="section-label">Claimed Citation &mdash; Ref #{entry.get('ref_number', '?')}</div>
+    <div class="citation-card">
+        <div class="citation-title">{title}</div>
+        <div>
+            <div class="meta-row"><span class="meta-label">Authors</span><span class="meta-value">{authors or 'N/A'}</span></div>
+            <div class="meta-row"><span class="meta-label">Journal</span><span class="meta-value">{venue or 'N/A'} {year or ''}</span></div>
+            <div class="meta-row"><span class="meta-label">PMID</span><span class="meta-value">{pmid_link}</span></div>
+            <div class="meta-row"><span class="meta-label">DOI</span><span class="meta-value">{doi_link}</span></div>
+        </div>
+    </div>
+    """
+
+    # What PMID actually resolves to
+    actual_pmid = entry.get("actual_title_pmid", "")
+    actual_doi = entry.get("actual_title_doi", "")
+    actual = actual_pmid or actual_doi or ""
+
+    if actual and actual != title:
+        html["actual"] = f"""
+        <div class="actual-card">
+            <div style="font-family:'DM Mono',monospace; font-size:9px; color:#918e85; text-transform:uppercase; letter-spacing:1px; margin-bottom:4px;">PMID actually resolves to</div>
+            <div class="actual-title">{actual[:300]}</div>
+            <div class="actual-note">The paper at PMID {pmid} is a different paper than claimed above</div>
+        </div>
+        """
+
+    # Search links
+    encoded_title = entry["_encoded_title"]
+    first_author = entry["_first_author"]
+    year_lo = entry["_year_lo"]
+    year_hi = entry["_year_hi"]
+
+    html["search"] = f"""
+    <div class="section-label">Search Title</div>
+    <div style="display:flex; flex-wrap:wrap; margin-bottom:4px;">
+        <a class="search-btn" href="https://pubmed.ncbi.nlm.nih.gov/?term={encoded_title}" target="_blank">PubMed</a>
+        <a class="search-btn" href="https://scholar.google.com/scholar?q={encoded_title}" target="_blank">Google Scholar</a>
+        <a class="search-btn" href="https://search.crossref.org/?q={encoded_title}&from_ui=yes" target="_blank">CrossRef</a>
+        <a class="search-btn" href="https://openalex.org/works?page=1&filter=title.search%3A{encoded_title}" target="_blank">OpenAlex</a>
+    </div>
+    """
+
+    if first_author:
+        html["author_search"] = f"""
+        <div style="margin-bottom:6px;">
+            <a class="search-btn" href="https://pubmed.ncbi.nlm.nih.gov/?term={first_author}%5Bfirst+author%5D+AND+{year_lo}%3A{year_hi}%5Bdp%5D" target="_blank">
+                PubMed: {first_author.replace('+', ' ')} [{year_lo}-{year_hi}]
+            </a>
+        </div>
+        """
+
+    return html
+
+@st.cache_resource
 def load_sample():
-    with open(SAMPLE_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+    """Parse the sample once per server process.
+
+    Returns (entries, list position by review_id, pre-rendered HTML by review_id).
+    """
+    with open(SAMPLE_PATH, "rb") as f:
+        raw = f.read()
+    sample = loads_json(raw)
+    for e in sample:
+        # Derived search-link fields, computed once instead of per render
+        e["_encoded_title"], e["_first_author"], e["_year_lo"], e["_year_hi"] = entry_links(
+            e.get("claimed_title", "N/A"), e.get("claimed_authors", ""), e.get("claimed_year", "")
+        )
+    return (
+        sample,
+        {e["review_id"]: i for i, e in enumerate(sample)},
+        {e["review_id"]: build_entry_html(e) for e in sample},
+    )
 
 def get_reviewer_id():
     if "reviewer_id" not in st.session_state:
@@ -154,11 +289,28 @@ def get_reviewer_id():
     return st.session_state.reviewer_id
 
 def get_verdicts_db(reviewer_id):
-    return os.path.join(VERDICTS_DIR, f"reviewer_{reviewer_id}.db")
+    return f"{_DB_PREFIX}{reviewer_id}.db"
+
+@st.cache_resource
+def get_conn(reviewer_id):
+    """One autocommit connection per reviewer, shared for the life of the server process."""
+    # Streamlit re-executes this file on every rerun, so create the dir here, once
+    os.makedirs(VERDICTS_DIR, exist_ok=True)
+    conn = sqlite3.connect(
+        get_verdicts_db(reviewer_id), isolation_level=None, check_same_thread=False, cached_statements=256
+    )
+    # Per-connection settings, applied once when the connection is opened
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    # Upper bounds, not allocations: the whole file is mapped and cached long before either is hit
+    conn.execute("PRAGMA cache_size=-65536")
+    conn.execute("PRAGMA mmap_size=268435456")
+    return conn
 
 def init_verdicts_db(reviewer_id):
-    db_path = get_verdicts_db(reviewer_id)
-    conn = sqlite3.connect(db_path)
+    conn = get_conn(reviewer_id)
+    # WAL is persistent per database file, so setting it once here is enough
+    conn.execute("PRAGMA journal_mode=WAL")
     conn.execute("""
         CREATE TABLE IF NOT EXISTS verdicts (
             review_id INTEGER PRIMARY KEY,
@@ -166,49 +318,181 @@ def init_verdicts_db(reviewer_id):
             verdict TEXT, notes TEXT, reviewed_at TEXT
         )
     """)
-    conn.commit()
-    conn.close()
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_verdict ON verdicts(verdict)")
+
+# Kept as one constant so sqlite3's statement cache reuses the prepared INSERT
+INSERT_VERDICT_SQL = """
+    INSERT INTO verdicts (review_id, pmc_id, ref_number, verdict, notes, reviewed_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(review_id) DO UPDATE SET
+        verdict=excluded.verdict, notes=excluded.notes, reviewed_at=excluded.reviewed_at
+"""
 
 def save_verdict(reviewer_id, review_id, pmc_id, ref_number, verdict, notes=""):
-    db_path = get_verdicts_db(reviewer_id)
-    conn = sqlite3.connect(db_path)
-    conn.execute("""
-        INSERT OR REPLACE INTO verdicts (review_id, pmc_id, ref_number, verdict, notes, reviewed_at)
-        VALUES (?, ?, ?, ?, ?, ?)
-    """, (review_id, pmc_id, ref_number, verdict, notes, datetime.now().isoformat()))
-    conn.commit()
-    conn.close()
+    """Write one verdict and keep the session's in-memory copies in step."""
+    reviewed_at = datetime.now().isoformat()
+    get_conn(reviewer_id).execute(
+        INSERT_VERDICT_SQL, (review_id, pmc_id, ref_number, verdict, notes, reviewed_at)
+    )
+    verdicts = st.session_state.get("verdicts")
+    if verdicts is None:
+        return
+    previous = verdicts.get(review_id)
+    verdicts[review_id] = {"verdict": verdict, "notes": notes, "reviewed_at": reviewed_at}
+    st.session_state.pop("export_rows", None)
+    unreviewed = st.session_state.get("unreviewed")
+    if unreviewed:
+        i = bisect.bisect_left(unreviewed, review_id)
+        if i < len(unreviewed) and unreviewed[i] == review_id:
+            del unreviewed[i]
+    v_counts = st.session_state.get("v_counts")
+    if v_counts is not None:
+        if previous:
+            v_counts[previous["verdict"]] -= 1
+        v_counts[verdict] = v_counts.get(verdict, 0) + 1
 
 def load_verdicts(reviewer_id):
-    db_path = get_verdicts_db(reviewer_id)
-    if not os.path.exists(db_path):
-        return {}
-    conn = sqlite3.connect(db_path)
-    rows = conn.execute("SELECT review_id, verdict, notes, reviewed_at FROM verdicts").fetchall()
-    conn.close()
+    # Always called after init_verdicts_db, so the file and table exist
+    rows = get_conn(reviewer_id).execute("SELECT review_id, verdict, notes, reviewed_at FROM verdicts").fetchall()
     return {r[0]: {"verdict": r[1], "notes": r[2], "reviewed_at": r[3]} for r in rows}
 
-def export_verdicts_json(reviewer_id):
-    verdicts = load_verdicts(reviewer_id)
+def count_verdicts(reviewer_id):
+    """{verdict: count} for one reviewer, aggregated in SQL."""
+    return dict(get_conn(reviewer_id).execute("SELECT verdict, COUNT(*) FROM verdicts GROUP BY verdict").fetchall())
+
+def export_rows(verdicts):
+    return [{"review_id": rid, **data} for rid, data in sorted(verdicts.items())]
+
+def export_verdicts_json(reviewer_id, rows):
     export = {
         "reviewer": reviewer_id,
         "exported_at": datetime.now().isoformat(),
-        "total_reviewed": len(verdicts),
-        "verdicts": [{"review_id": rid, **data} for rid, data in sorted(verdicts.items())]
+        "total_reviewed": len(rows),
+        "verdicts": rows,
     }
-    return json.dumps(export, indent=2)
+    return dumps_json(export)
 
-def get_next_unreviewed(verdicts, total):
-    for i in range(1, total + 1):
-        if i not in verdicts:
-            return i
-    return None
+def get_next_unreviewed():
+    unreviewed = st.session_state.get("unreviewed")
+    return unreviewed[0] if unreviewed else None
 
 
 # ─── Login ────────────────────────────────────────────────────────────────
 
 # ─── Admin page (?admin=1) ───────────────────────────────────────────────
 
+def _verdict_files_key():
+    """(reviewer id, path, db mtime, wal mtime) for every reviewer DB — cache key for the admin scan."""
+    if not os.path.exists(VERDICTS_DIR):
+        return ()
+    with os.scandir(VERDICTS_DIR) as it:
+        entries = sorted(
+            (e for e in it if e.name.startswith("reviewer_") and e.name.endswith(".db")),
+            key=lambda e: e.name,
+        )
+    key = []
+    for e in entries:
+        # Under WAL, new writes land in the -wal file until checkpoint
+        wal_path = e.path + "-wal"
+        wal_mtime = os.path.getmtime(wal_path) if os.path.exists(wal_path) else 0
+        key.append((e.name[len("reviewer_"):-len(".db")], e.path, e.stat().st_mtime, wal_mtime))
+    return tuple(key)
+
+# SQLite's default SQLITE_MAX_ATTACHED
+ATTACH_BATCH = 10
+
+VERDICT_COLS = "review_id, pmc_id, ref_number, verdict, notes, reviewed_at"
+
+def _attached_error(e, alias):
+    """Error text for one reviewer, without the internal ATTACH alias."""
+    return f"ERROR: {str(e).replace(f'{alias}.', '')}"
+
+def _read_attached(conn, attached):
+    """Counts + verdict rows for the given (alias, rid) pairs, one UNION ALL per query."""
+    result = {rid: {"counts": {}, "verdicts": []} for _, rid in attached}
+    rids = [rid for _, rid in attached]
+    conn.execute("BEGIN")
+    try:
+        counts_sql = " UNION ALL ".join(
+            f"SELECT ?, verdict, COUNT(*) FROM {alias}.verdicts GROUP BY verdict" for alias, _ in attached
+        )
+        for rid, verdict, n in conn.execute(counts_sql, rids):
+            result[rid]["counts"][verdict] = n
+        rows_sql = " UNION ALL ".join(f"SELECT ?, {VERDICT_COLS} FROM {alias}.verdicts" for alias, _ in attached)
+        for r in conn.execute(rows_sql + " ORDER BY 2", rids):
+            result[r[0]]["verdicts"].append(
+                {"review_id": r[1], "pmc_id": r[2], "ref_number": r[3],
+                 "verdict": r[4], "notes": r[5], "reviewed_at": r[6]}
+            )
+    finally:
+        conn.execute("COMMIT")
+    return result
+
+@st.cache_data(ttl=10)
+def load_all_reviewers(files_key):
+    """Read counts + verdict rows from every reviewer DB, attached to one in-memory connection."""
+    all_reviewers = {}
+    conn = sqlite3.connect(":memory:", isolation_level=None)
+    conn.execute("PRAGMA query_only=1")
+    try:
+        for start in range(0, len(files_key), ATTACH_BATCH):
+            attached = []
+            for i, (rid, db_path, _, _) in enumerate(files_key[start:start + ATTACH_BATCH]):
+                alias = f"r{i}"
+                try:
+                    conn.execute(f"ATTACH DATABASE ? AS {alias}", (db_path,))
+                except Exception as e:
+                    all_reviewers[rid] = _attached_error(e, alias)
+                    continue
+                try:
+                    # Catches missing tables / non-DB files; data-page damage only shows on a full read
+                    conn.execute(f"SELECT {VERDICT_COLS} FROM {alias}.verdicts LIMIT 0")
+                except Exception as e:
+                    conn.execute(f"DETACH DATABASE {alias}")
+                    all_reviewers[rid] = _attached_error(e, alias)
+                    continue
+                attached.append((alias, rid))
+                all_reviewers[rid] = None  # keep file order; filled in below
+            if not attached:
+                continue
+
+            try:
+                all_reviewers.update(_read_attached(conn, attached))
+            except sqlite3.DatabaseError:
+                # A damaged file fails the whole UNION; read each one alone so only it is marked
+                for alias, rid in attached:
+                    try:
+                        all_reviewers.update(_read_attached(conn, [(alias, rid)]))
+                    except sqlite3.DatabaseError as e:
+                        all_reviewers[rid] = _attached_error(e, alias)
+            for alias, _ in attached:
+                conn.execute(f"DETACH DATABASE {alias}")
+    finally:
+        conn.close()
+    return all_reviewers
+
+@st.cache_data(max_entries=1)
+def backup_reviewers(files_key):
+    """Per-reviewer backup payload; only rebuilt when some reviewer DB has changed."""
+    reviewers = {}
+    for rid, data in load_all_reviewers(files_key).items():
+        if isinstance(data, str):
+            reviewers[rid] = {"error": data}
+        else:
+            reviewers[rid] = {
+                "total_reviewed": len(data["verdicts"]),
+                "verdicts": data["verdicts"],
+            }
+    return reviewers
+
+def build_backup_json(files_key):
+    """Full backup JSON, stamped with the time of this download."""
+    backup = {
+        "exported_at": datetime.now().isoformat(),
+        "reviewers": backup_reviewers(files_key),
+    }
+    return dumps_json(backup, indent=True)
+
 def admin_page():
     """Admin dashboard: shows all reviewers' progress + full backup download."""
     st.html("""
@@ -220,20 +504,8 @@ def admin_page():
     </div>
     """)
 
-    # Find all reviewer DBs
-    all_reviewers = {}
-    if os.path.exists(VERDICTS_DIR):
-        for fname in sorted(os.listdir(VERDICTS_DIR)):
-            if fname.startswith("reviewer_") and fname.endswith(".db"):
-                rid = fname.replace("reviewer_", "").replace(".db", "")
-                db_path = os.path.join(VERDICTS_DIR, fname)
-                try:
-                    conn = sqlite3.connect(db_path)
-                    rows = conn.execute("SELECT review_id, pmc_id, ref_number, verdict, notes, reviewed_at FROM verdicts ORDER BY review_id").fetchall()
-                    conn.close()
-                    all_reviewers[rid] = rows
-                except Exception as e:
-                    all_reviewers[rid] = f"ERROR: {e}"
+    files_key = _verdict_files_key()
+    all_reviewers = load_all_reviewers(files_key)
 
     if not all_reviewers:
         st.warning("No reviewer verdict files found yet.")
@@ -241,56 +513,36 @@ def admin_page():
 
     # Summary table
     st.subheader("Reviewer Progress")
-    for rid, rows in all_reviewers.items():
-        if isinstance(rows, str):
-            st.error(f"**{rid}**: {rows}")
+    for rid, data in all_reviewers.items():
+        if isinstance(data, str):
+            st.error(f"**{rid}**: {data}")
             continue
-        v_counts = {}
-        for r in rows:
-            v_counts[r[3]] = v_counts.get(r[3], 0) + 1
-        summary = " · ".join(f"{k}: {v}" for k, v in sorted(v_counts.items()))
-        st.write(f"**{rid}**: {len(rows)}/100 reviewed — {summary}")
+        summary = " · ".join(f"{k}: {v}" for k, v in sorted(data["counts"].items()))
+        st.write(f"**{rid}**: {len(data['verdicts'])}/100 reviewed — {summary}")
 
     # Full backup as JSON
     st.subheader("Full Backup")
-    backup = {
-        "exported_at": datetime.now().isoformat(),
-        "reviewers": {}
-    }
-    for rid, rows in all_reviewers.items():
-        if isinstance(rows, str):
-            backup["reviewers"][rid] = {"error": rows}
-        else:
-            backup["reviewers"][rid] = {
-                "total_reviewed": len(rows),
-                "verdicts": [
-                    {"review_id": r[0], "pmc_id": r[1], "ref_number": r[2],
-                     "verdict": r[3], "notes": r[4], "reviewed_at": r[5]}
-                    for r in rows
-                ]
-            }
-
-    backup_json = json.dumps(backup, indent=2, ensure_ascii=False)
+    total_verdicts = sum(len(d["verdicts"]) for d in all_reviewers.values() if not isinstance(d, str))
     st.download_button(
-        f"Download Full Backup ({sum(len(r) for r in all_reviewers.values() if isinstance(r, list))} verdicts)",
-        data=backup_json,
+        f"Download Full Backup ({total_verdicts} verdicts)",
+        data=build_backup_json(files_key),
         file_name=f"citadel_verdicts_backup_{datetime.now().strftime('%Y%m%d_%H%M')}.json",
         mime="application/json",
         use_container_width=True,
     )
 
     # Show raw data per reviewer
-    for rid, rows in all_reviewers.items():
-        if isinstance(rows, str):
+    for rid, data in all_reviewers.items():
+        if isinstance(data, str):
             continue
-        with st.expander(f"{rid} — {len(rows)} verdicts"):
-            for r in rows:
-                st.text(f"  #{r[0]:3d} | {r[1]} ref {r[2]} | {r[3]:20s} | {r[5]}")
+        with st.expander(f"{rid} — {len(data['verdicts'])} verdicts"):
+            for v in data["verdicts"]:
+                st.text(f"  #{v['review_id']:3d} | {v['pmc_id']} ref {v['ref_number']} | {v['verdict']:20s} | {v['reviewed_at']}")
 
 
 # ─── Main app ────────────────────────────────────────────────────────────
 
-sample = load_sample()
+sample, sample_pos, entry_html = load_sample()
 total = len(sample)
 
 # Admin mode
@@ -323,7 +575,6 @@ if reviewer_id is None:
             if name.strip():
                 rid = name.strip().lower().replace(" ", "_")
                 st.session_state.reviewer_id = rid
-                init_verdicts_db(rid)
                 st.rerun()
             else:
                 st.warning("Please enter your name")
@@ -340,21 +591,67 @@ if reviewer_id is None:
     st.stop()
 
 
+# ─── Navigation callbacks ────────────────────────────────────────────────
+
+def go_to(idx):
+    st.session_state.current_idx = idx
+
+def jump_to():
+    st.session_state.current_idx = st.session_state.jump_to - 1
+
+def save_and_next(reviewer_id, entry, existing, idx):
+    review_id = entry["review_id"]
+    verdict = st.session_state.verdict_current
+    notes = st.session_state.notes_current
+    # Paging through already-reviewed entries shouldn't rewrite them
+    if not (existing and existing["verdict"] == verdict and existing["notes"] == notes):
+        save_verdict(reviewer_id, review_id, entry["pmc_id"], entry["ref_number"], verdict, notes)
+    if idx < total - 1:
+        st.session_state.current_idx = idx + 1
+
+def logout():
+    st.session_state.reviewer_id = None
+    for key in ("current_idx", "last_idx", "verdicts", "unreviewed", "v_counts", "export_rows"):
+        if key in st.session_state:
+            del st.session_state[key]
+
+
 # ─── Main review interface ────────────────────────────────────────────────
 
-init_verdicts_db(reviewer_id)
-verdicts = load_verdicts(reviewer_id)
-reviewed_count = len(verdicts)
+# Loaded once per login; save_verdict keeps it in step with the DB
+if "verdicts" not in st.session_state:
+    init_verdicts_db(reviewer_id)
+    st.session_state.verdicts = load_verdicts(reviewer_id)
+verdicts = st.session_state.verdicts
+
+# Per-verdict totals, kept current by save_verdict so reruns don't re-query
+if "v_counts" not in st.session_state:
+    st.session_state.v_counts = count_verdicts(reviewer_id)
+v_counts = st.session_state.v_counts
+reviewed_count = sum(v_counts.values())
+
+# Sorted review_ids still to do; save_verdict removes ids as they're saved
+if "unreviewed" not in st.session_state:
+    st.session_state.unreviewed = sorted(sample_pos.keys() - verdicts.keys())
 
 if "current_idx" not in st.session_state:
-    next_unrev = get_next_unreviewed(verdicts, total)
-    st.session_state.current_idx = (next_unrev or 1) - 1
+    next_unrev = get_next_unreviewed()
+    st.session_state.current_idx = sample_pos[next_unrev] if next_unrev else 0
 
 idx = st.session_state.current_idx
 entry = sample[idx]
 review_id = entry["review_id"]
 existing = verdicts.get(review_id)
 
+# The verdict widgets use fixed keys, so prime them whenever the entry changes
+if st.session_state.get("last_idx") != idx:
+    if existing and existing["verdict"] in VERDICT_LABELS:
+        st.session_state.verdict_current = existing["verdict"]
+    else:
+        st.session_state.verdict_current = VERDICT_KEYS[0]
+    st.session_state.notes_current = existing["notes"] if existing else ""
+    st.session_state.last_idx = idx
+
 pct_done = reviewed_count / total * 100
 
 # ── Top bar ──
@@ -375,140 +672,53 @@ st.html(f"""
 """)
 
 # ── Source paper banner (top, before anything) ──
-source_title = entry.get("paper_title", "")
-source_journal = entry.get("journal", "")
-pmc_id = entry.get("pmc_id", "")
-
-if source_title:
-    pmc_link = f"https://www.ncbi.nlm.nih.gov/pmc/articles/{pmc_id}/"
-    st.html(f"""
-    <div class="source-banner">
-        <span class="source-label">Citing Article</span>
-        <a href="{pmc_link}" target="_blank">{source_title[:120]}{'...' if len(source_title) > 120 else ''}</a>
-        <span style="color:#918e85;"> &middot; {source_journal} &middot; {pmc_id}</span>
-    </div>
-    """)
+html = entry_html[review_id]
+if html["source"]:
+    st.html(html["source"])
 
 # ── Two-column layout ──
 left, right = st.columns([3, 2], gap="large")
 
 with left:
-    # Claimed citation
-    title = entry.get("claimed_title", "N/A")
-    pmid = entry.get("claimed_pmid", "")
-    doi = entry.get("claimed_doi", "")
-    authors = entry.get("claimed_authors", "")
-    venue = entry.get("claimed_venue", "")
-    year = entry.get("claimed_year", "")
-
-    pmid_link = f'<a href="https://pubmed.ncbi.nlm.nih.gov/{pmid}/" target="_blank">{pmid}</a>' if pmid else "N/A"
-    doi_link = f'<a href="https://doi.org/{doi}" target="_blank">{doi}</a>' if doi else "N/A"
-
-    st.html(f"""
-    <div class="section-label">Claimed Citation &mdash; Ref #{entry.get('ref_number', '?')}</div>
-    <div class="citation-card">
-        <div class="citation-title">{title}</div>
-        <div>
-            <div class="meta-row"><span class="meta-label">Authors</span><span class="meta-value">{authors or 'N/A'}</span></div>
-            <div class="meta-row"><span class="meta-label">Journal</span><span class="meta-value">{venue or 'N/A'} {year or ''}</span></div>
-            <div class="meta-row"><span class="meta-label">PMID</span><span class="meta-value">{pmid_link}</span></div>
-            <div class="meta-row"><span class="meta-label">DOI</span><span class="meta-value">{doi_link}</span></div>
-        </div>
-    </div>
-    """)
-
-    # What PMID actually resolves to
-    actual_pmid = entry.get("actual_title_pmid", "")
-    actual_doi = entry.get("actual_title_doi", "")
-    actual = actual_pmid or actual_doi or ""
-
-    if actual and actual != title:
-        st.html(f"""
-        <div class="actual-card">
-            <div style="font-family:'DM Mono',monospace; font-size:9px; color:#918e85; text-transform:uppercase; letter-spacing:1px; margin-bottom:4px;">PMID actually resolves to</div>
-            <div class="actual-title">{actual[:300]}</div>
-            <div class="actual-note">The paper at PMID {pmid} is a different paper than claimed above</div>
-        </div>
-        """)
+    st.html(html["card"])
+    if html["actual"]:
+        st.html(html["actual"])
 
 
 with right:
-    # Search links
-    encoded_title = urllib.parse.quote(title[:200])
-    first_author = (authors.split(";")[0].split(",")[0].strip() if authors else "").replace(" ", "+")
-    year_int = int(year) if year and str(year).isdigit() else 2024
-    year_lo = year_int - 1
-    year_hi = year_int + 1
-
-    st.html(f"""
-    <div class="section-label">Search Title</div>
-    <div style="display:flex; flex-wrap:wrap; margin-bottom:4px;">
-        <a class="search-btn" href="https://pubmed.ncbi.nlm.nih.gov/?term={encoded_title}" target="_blank">PubMed</a>
-        <a class="search-btn" href="https://scholar.google.com/scholar?q={encoded_title}" target="_blank">Google Scholar</a>
-        <a class="search-btn" href="https://search.crossref.org/?q={encoded_title}&from_ui=yes" target="_blank">CrossRef</a>
-        <a class="search-btn" href="https://openalex.org/works?page=1&filter=title.search%3A{encoded_title}" target="_blank">OpenAlex</a>
-    </div>
-    """)
-
-    if first_author:
-        st.html(f"""
-        <div style="margin-bottom:6px;">
-            <a class="search-btn" href="https://pubmed.ncbi.nlm.nih.gov/?term={first_author}%5Bfirst+author%5D+AND+{year_lo}%3A{year_hi}%5Bdp%5D" target="_blank">
-                PubMed: {first_author.replace('+', ' ')} [{year_lo}-{year_hi}]
-            </a>
-        </div>
-        """)
+    st.html(html["search"])
+    if html["author_search"]:
+        st.html(html["author_search"])
 
     # Verdict
     st.html('<div class="section-label">Your Verdict</div>')
 
-    verdict_options = {
-        "fabricated": "Fabricated Citation \u2014 Does not exist anywhere",
-        "not_fabricated": "Not Fabricated \u2014 Paper exists (even if PMID/DOI wrong)",
-        "unsure": "Unsure \u2014 Cannot determine",
-    }
-
-    default_idx = 0
-    if existing:
-        v = existing["verdict"]
-        keys = list(verdict_options.keys())
-        if v in keys:
-            default_idx = keys.index(v)
-
-    verdict = st.radio(
+    st.radio(
         "Verdict",
-        options=list(verdict_options.keys()),
-        format_func=lambda x: verdict_options[x],
-        index=default_idx,
+        options=VERDICT_KEYS,
+        format_func=lambda x: VERDICT_LABELS[x],
         label_visibility="collapsed",
-        key=f"verdict_{review_id}",
+        key="verdict_current",
     )
 
-    notes = st.text_area(
+    st.text_area(
         "Notes (optional)",
-        value=existing["notes"] if existing else "",
         placeholder="Optional notes...",
         height=60,
-        key=f"notes_{review_id}",
+        key="notes_current",
     )
 
-    # Action buttons
+    # Action buttons — callbacks mutate state before Streamlit's own rerun,
+    # so no explicit st.rerun() (which would run the whole script twice)
     col_prev, col_save, col_skip = st.columns([1, 2, 1])
     with col_prev:
-        if st.button("< Prev", use_container_width=True, disabled=(idx == 0)):
-            st.session_state.current_idx = max(0, idx - 1)
-            st.rerun()
+        st.button("< Prev", use_container_width=True, disabled=(idx == 0),
+                  on_click=go_to, args=(max(0, idx - 1),))
     with col_save:
-        if st.button("Save & Next >", type="primary", use_container_width=True):
-            save_verdict(reviewer_id, review_id, entry["pmc_id"], entry["ref_number"], verdict, notes)
-            if idx < total - 1:
-                st.session_state.current_idx = idx + 1
-            st.rerun()
+        st.button("Save & Next >", type="primary", use_container_width=True,
+                  on_click=save_and_next, args=(reviewer_id, entry, existing, idx))
     with col_skip:
-        if st.button("Skip >", use_container_width=True):
-            if idx < total - 1:
-                st.session_state.current_idx = idx + 1
-            st.rerun()
+        st.button("Skip >", use_container_width=True, on_click=go_to, args=(min(idx + 1, total - 1),))
 
     if existing:
         st.success(f"Previously: **{existing['verdict']}**")
@@ -516,52 +726,35 @@ with right:
     # Navigation row
     nav1, nav2, nav3 = st.columns([1, 1, 1])
     with nav1:
-        jump = st.number_input("Go to #", min_value=1, max_value=total, value=idx + 1, key="jump_to", label_visibility="collapsed")
+        st.number_input("Go to #", min_value=1, max_value=total, value=idx + 1, key="jump_to", label_visibility="collapsed")
     with nav2:
-        if st.button("Go", key="go_btn", use_container_width=True):
-            st.session_state.current_idx = jump - 1
-            st.rerun()
+        st.button("Go", key="go_btn", use_container_width=True, on_click=jump_to)
     with nav3:
-        next_unrev = get_next_unreviewed(verdicts, total)
+        next_unrev = get_next_unreviewed()
         if next_unrev:
-            if st.button(f"Next unreviewed (#{next_unrev})", key="jump_unrev", use_container_width=True):
-                st.session_state.current_idx = next_unrev - 1
-                st.rerun()
+            st.button(f"Next unreviewed (#{next_unrev})", key="jump_unrev", use_container_width=True,
+                      on_click=go_to, args=(sample_pos[next_unrev],))
 
-    # Compact progress + export
+    # Compact progress + export, folded away from the Save & Next hot path
     if reviewed_count > 0:
-        v_counts = {}
-        for v in verdicts.values():
-            v_counts[v["verdict"]] = v_counts.get(v["verdict"], 0) + 1
-
-        st.html(f"""
-        <div style="font-family:'DM Mono',monospace; font-size:11px; margin-top:8px;">
-            <span style="color:#c23030;">Fabricated: {v_counts.get('fabricated', 0)}</span> &middot;
-            <span style="color:#2d8a52;">Not Fab: {v_counts.get('not_fabricated', 0)}</span> &middot;
-            <span style="color:#555550;">Unsure: {v_counts.get('unsure', 0)}</span> &middot;
-            <span>{reviewed_count}/{total}</span>
-        </div>
-        """)
-
-        json_export = export_verdicts_json(reviewer_id)
-        col_exp, col_logout = st.columns(2)
-        with col_exp:
+        with st.expander("Stats & Backup", expanded=False):
+            st.html(f"""
+            <div style="font-family:'DM Mono',monospace; font-size:11px; margin-top:8px;">
+                <span style="color:#c23030;">Fabricated: {v_counts.get('fabricated', 0)}</span> &middot;
+                <span style="color:#2d8a52;">Not Fab: {v_counts.get('not_fabricated', 0)}</span> &middot;
+                <span style="color:#555550;">Unsure: {v_counts.get('unsure', 0)}</span> &middot;
+                <span>{reviewed_count}/{total}</span>
+            </div>
+            """)
+
+            # Expanders still run their body, so reuse the sorted rows until the next save
+            if "export_rows" not in st.session_state:
+                st.session_state.export_rows = export_rows(verdicts)
             st.download_button(
                 f"Export ({reviewed_count})",
-                data=json_export,
+                data=export_verdicts_json(reviewer_id, st.session_state.export_rows),
                 file_name=f"citadel_verdicts_{reviewer_id}_{datetime.now().strftime('%Y%m%d')}.json",
                 mime="application/json",
                 use_container_width=True,
             )
-        with col_logout:
-            if st.button("Logout", key="logout", use_container_width=True):
-                st.session_state.reviewer_id = None
-                if "current_idx" in st.session_state:
-                    del st.session_state.current_idx
-                st.rerun()
-    else:
-        if st.button("Logout", key="logout"):
-            st.session_state.reviewer_id = None
-            if "current_idx" in st.session_state:
-                del st.session_state.current_idx
-            st.rerun()
+    st.button("Logout", key="logout", on_click=logout)